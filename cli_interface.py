@@ -3,35 +3,256 @@ Interactive Command Line Interface for Resume Analyzer
 Provides user-friendly menu-driven interaction
 """
 
+import bisect
+import functools
+import hashlib
+import mmap
 import os
+import sys
 import json
-from resume_analyzer import ResumeAnalyzer
+from collections import OrderedDict
+from contextlib import suppress
+from resume_analyzer import ResumeAnalyzer, _write_report
+
+
+@functools.lru_cache(maxsize=1)
+def _get_analyzer():
+    """Create the shared ResumeAnalyzer, reused across CLI instances"""
+    return ResumeAnalyzer()
+
+
+BAR80 = "=" * 80
+SEP80 = "-" * 80
+BAR100 = "=" * 100
+SEP100 = "-" * 100
+
+# Bound once so the format spec is parsed a single time, not per row
+_ROW_FMT = "{:<6} {:<25} {:<30} {:<8} {:<20}".format
+
+
+# On-disk analysis cache shared across sessions
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "resume_analyzer")
+_CACHE_CAP = 256  # max cached analyses kept on disk
+_MEM_CACHE_CAP = 256  # max cached analyses kept in memory
 
 
 class ResumeAnalyzerCLI:
     """Command-line interface for Resume Analyzer"""
-    
-    def __init__(self):
-        self.analyzer = ResumeAnalyzer()
+
+    _MENU = (
+        ("1", "Set Job Requirements"),
+        ("2", "Analyze Resume (Manual Entry)"),
+        ("3", "Load Resume from File"),
+        ("4", "View All Results"),
+        ("5", "Save All Results"),
+        ("6", "Load Previous Results"),
+        ("7", "Run Demo"),
+        ("8", "Purge Analysis Cache"),
+        ("9", "Exit")
+    )
+
+    _DISPATCH = {
+        "1": "setup_job_requirements",
+        "2": "analyze_single_resume",
+        "3": "load_resume_from_file",
+        "4": "view_all_results",
+        "5": "save_all_results",
+        "6": "load_previous_results",
+        "7": "run_demo",
+        "8": "purge_cache"
+    }
+
+    def __init__(self, use_disk_cache=True):
+        self.use_disk_cache = use_disk_cache
         self.job_requirements = {}
         self.analyzed_resumes = []
+        self._analysis_cache = OrderedDict()
+        self._ranked = []
+        self._score_sum = 0.0
+        self._recommended_count = 0
+        self._line_buf = bytearray()
+        self._menu_cache = {}
+        self._seen_hashes = set()
+        self._job_req_block = None
+
+    @functools.cached_property
+    def analyzer(self):
+        """Analyzer instance, created lazily on first use"""
+        return _get_analyzer()
+
+    def _cache_key(self, resume_text, job_requirements):
+        """Build a cache key from resume text and job requirements"""
+        text_hash = hashlib.sha1(resume_text.encode('utf-8')).hexdigest()
+        reqs_hash = hashlib.sha1(
+            json.dumps(job_requirements, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        return text_hash + ":" + reqs_hash
+
+    def _cached_analyze(self, resume_text, job_requirements):
+        """
+        Analyze a resume, reusing a cached result when the same resume
+        has already been analyzed against the same job requirements
+        """
+        key = self._cache_key(resume_text, job_requirements)
+        analysis = self._analysis_cache.get(key)
+        if analysis is not None:
+            self._analysis_cache.move_to_end(key)
+            return analysis
+
+        analysis = self._disk_cache_get(key)
+        if analysis is None:
+            analysis = self.analyzer.analyze_resume(resume_text, job_requirements)
+            self._disk_cache_put(key, analysis)
+        self._cache_store(key, analysis)
+        return analysis
+
+    def _cache_store(self, key, analysis):
+        """Insert into the in-memory LRU cache, evicting the oldest entry"""
+        cache = self._analysis_cache
+        cache[key] = analysis
+        cache.move_to_end(key)
+        while len(cache) > _MEM_CACHE_CAP:
+            cache.popitem(last=False)
+
+    def _disk_cache_path(self, key):
+        return os.path.join(_CACHE_DIR, key + ".json")
+
+    def _disk_cache_get(self, key):
+        """Look up a persisted analysis from a previous session"""
+        if not self.use_disk_cache:
+            return None
+        path = self._disk_cache_path(key)
+        # Open directly instead of stat-then-open: one syscall, no race
+        # with a concurrent purge
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _disk_cache_put(self, key, analysis):
+        """Persist an analysis for future sessions, evicting old entries"""
+        if not self.use_disk_cache:
+            return
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            with open(self._disk_cache_path(key), 'w', encoding='utf-8') as f:
+                # default=list flattens the frozenset views parse_resume
+                # caches on resume_data, same as save_data
+                json.dump(analysis, f, default=list)
+            self._evict_disk_cache()
+        except (OSError, TypeError, ValueError):
+            # A failed cache write must never take down the analysis
+            pass
+
+    def _evict_disk_cache(self):
+        """Drop least-recently-used entries once the cache exceeds its cap"""
+        entries = [os.path.join(_CACHE_DIR, name) for name in os.listdir(_CACHE_DIR)]
+        if len(entries) <= _CACHE_CAP:
+            return
+        entries.sort(key=lambda path: os.stat(path).st_atime)
+        for path in entries[:len(entries) - _CACHE_CAP]:
+            with suppress(OSError):
+                os.unlink(path)
+
+    def purge_cache(self):
+        """Purge the in-memory and on-disk analysis caches"""
+        self.clear_screen()
+        self.print_header("PURGE ANALYSIS CACHE")
+
+        self._analysis_cache.clear()
+        removed = 0
+        if os.path.isdir(_CACHE_DIR):
+            for name in os.listdir(_CACHE_DIR):
+                with suppress(OSError):
+                    os.unlink(os.path.join(_CACHE_DIR, name))
+                    removed += 1
+
+        print(f"✓ Cache purged ({removed} analyses removed from disk).")
+        input("\nPress Enter to continue...")
+
+    def _analysis_hash(self, analysis):
+        """Content hash identifying an analysis for deduplication"""
+        resume_data = analysis.get('resume_data', {})
+        resume_hash = resume_data.get('resume_hash')
+        if resume_hash:
+            return resume_hash
+        raw_text = resume_data.get('raw_text', '')
+        if raw_text:
+            return hashlib.sha1(raw_text.encode('utf-8')).hexdigest()
+        return f"{resume_data.get('name', '')}|{resume_data.get('email', '')}"
+
+    def _record(self, analysis, dedupe=False):
+        """
+        Record a completed analysis, keeping the ranked view and running
+        statistics up to date incrementally.
+
+        With dedupe=True, analyses whose resume content was already
+        recorded are skipped — used when loading saved results. Live
+        analysis paths must not dedupe: re-analyzing a resume under new
+        job requirements is a new result, not a duplicate.
+
+        Returns True if the analysis was added.
+        """
+        h = self._analysis_hash(analysis)
+        if dedupe and h in self._seen_hashes:
+            return False
+        self._seen_hashes.add(h)
+        self.analyzed_resumes.append(analysis)
+        bisect.insort(self._ranked, analysis, key=lambda a: -a['match_score'])
+        self._score_sum += analysis['match_score']
+        if analysis['match_score'] >= 60:
+            self._recommended_count += 1
+        return True
+
+    def _cache_filename(self, filename):
+        """Sidecar cache file stored next to a results file"""
+        return filename + ".cache"
+
+    def _save_cache(self, filename):
+        """Persist the analysis cache alongside saved results"""
+        if self._analysis_cache:
+            self.analyzer.save_data(self._analysis_cache, self._cache_filename(filename))
+
+    def _load_cache(self, filename):
+        """Restore a previously saved analysis cache, if present"""
+        cached = self.analyzer.load_data(self._cache_filename(filename))
+        if isinstance(cached, dict):
+            for key, analysis in cached.items():
+                self._cache_store(key, analysis)
     
     def clear_screen(self):
         """Clear the console screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # Writing the ANSI clear sequence avoids forking a shell per
+        # menu transition; only legacy cmd.exe needs the old path
+        if os.name == 'nt' and not (os.environ.get('WT_SESSION') or os.environ.get('TERM')):
+            os.system('cls')
+        else:
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.flush()
     
     def print_header(self, title):
         """Print formatted header"""
-        print("\n" + "="*80)
-        print(f"{title.center(80)}")
-        print("="*80 + "\n")
+        sys.stdout.write(
+            "\n" + BAR80 + "\n" + title.center(80) + "\n" + BAR80 + "\n\n"
+        )
     
     def print_menu(self, title, options):
-        """Print formatted menu"""
-        self.print_header(title)
-        for key, value in options.items():
-            print(f"{key}. {value}")
-        print()
+        """Print formatted menu (rendered once per title/options pair)
+
+        Accepts either a dict or a tuple of (key, label) pairs.
+        """
+        items = tuple(options.items()) if isinstance(options, dict) else tuple(options)
+        key = (title, items)
+        block = self._menu_cache.get(key)
+        if block is None:
+            lines = ["", BAR80, title.center(80), BAR80, ""]
+            lines.extend(f"{k}. {v}" for k, v in items)
+            lines.append("")
+            block = '\n'.join(lines) + '\n'
+            self._menu_cache[key] = block
+        sys.stdout.write(block)
     
     def get_input(self, prompt, input_type=str, default=None):
         """Get and validate user input"""
@@ -66,16 +287,27 @@ class ResumeAnalyzerCLI:
         print("Options: High School, Associate, Bachelor, Master, PhD")
         required_education = self.get_input("Education: ", str, "Bachelor")
         
-        self.job_requirements = {
+        new_requirements = {
             "position": position,
             "required_skills": required_skills,
             "required_experience": required_experience,
             "required_education": required_education
         }
-        
-        print("\n" + "-"*80)
+
+        # Re-entering identical values is a no-op; don't rebuild the
+        # analyzer's derived matching state
+        if new_requirements == self.job_requirements:
+            print("\nJob requirements unchanged.")
+            input("\nPress Enter to continue...")
+            return
+
+        self.job_requirements = new_requirements
+        self.analyzer.configure(self.job_requirements)
+        self._job_req_block = None
+
+        print("\n" + SEP80)
         print("Job requirements saved successfully!")
-        print("-"*80)
+        print(SEP80)
         self.display_job_requirements()
         input("\nPress Enter to continue...")
     
@@ -85,10 +317,15 @@ class ResumeAnalyzerCLI:
             print("No job requirements set.")
             return
         
-        print(f"\nPosition: {self.job_requirements['position']}")
-        print(f"Required Skills: {', '.join(self.job_requirements['required_skills'])}")
-        print(f"Required Experience: {self.job_requirements['required_experience']} years")
-        print(f"Required Education: {self.job_requirements['required_education']}")
+        # Rendered once per requirements change, not once per menu tick
+        if self._job_req_block is None:
+            self._job_req_block = (
+                f"\nPosition: {self.job_requirements['position']}\n"
+                f"Required Skills: {', '.join(self.job_requirements['required_skills'])}\n"
+                f"Required Experience: {self.job_requirements['required_experience']} years\n"
+                f"Required Education: {self.job_requirements['required_education']}\n"
+            )
+        sys.stdout.write(self._job_req_block)
     
     def analyze_single_resume(self):
         """Analyze a single resume"""
@@ -100,30 +337,38 @@ class ResumeAnalyzerCLI:
             input("\nPress Enter to continue...")
             return
         
-        print("Enter resume text (type 'END' on a new line when done):")
-        print("-"*80)
-        
-        resume_lines = []
-        while True:
-            line = input()
-            if line.strip().upper() == 'END':
-                break
-            resume_lines.append(line)
-        
-        resume_text = '\n'.join(resume_lines)
+        print("Enter resume text (type 'END' on a new line when done,")
+        print("or 'PASTE' to read a pasted block ended by EOF - Ctrl-D, Ctrl-Z+Enter on Windows):")
+        print(SEP80)
+
+        first = input()
+        if first.strip().upper() == 'PASTE':
+            # One bulk read instead of one input() call per pasted line
+            resume_text = sys.stdin.read()
+        else:
+            # Accumulate into a reusable byte buffer instead of a
+            # throwaway list of lines
+            buf = self._line_buf
+            buf.clear()
+            line = first
+            while line.strip().upper() != 'END':
+                buf += line.encode('utf-8')
+                buf += b'\n'
+                line = input()
+            resume_text = buf.decode('utf-8')
         
         if not resume_text.strip():
             print("\n⚠ No resume text entered!")
             input("\nPress Enter to continue...")
             return
         
-        print("\n" + "-"*80)
+        print("\n" + SEP80)
         print("Analyzing resume...")
-        print("-"*80)
+        print(SEP80)
         
         # Perform analysis
-        analysis = self.analyzer.analyze_resume(resume_text, self.job_requirements)
-        self.analyzed_resumes.append(analysis)
+        analysis = self._cached_analyze(resume_text, self.job_requirements)
+        self._record(analysis)
         
         # Display results
         print(analysis['report'])
@@ -133,10 +378,9 @@ class ResumeAnalyzerCLI:
         if save == 'y':
             candidate_name = analysis['resume_data']['name'].replace(' ', '_')
             filename = f"report_{candidate_name}_{len(self.analyzed_resumes)}.txt"
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(analysis['report'])
-            
+
+            _write_report(filename, analysis['report'])
+
             print(f"\n✓ Report saved to: {filename}")
         
         input("\nPress Enter to continue...")
@@ -154,25 +398,31 @@ class ResumeAnalyzerCLI:
         filename = self.get_input("Enter resume file path: ")
         
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                resume_text = f.read()
-            
-            print("\n" + "-"*80)
+            # Map the file instead of reading it whole; avoids a transient
+            # large allocation for big resume dumps
+            with open(filename, 'rb') as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        resume_text = mm[:].decode('utf-8', errors='replace')
+                except ValueError:
+                    # Empty files cannot be mapped
+                    resume_text = f.read().decode('utf-8', errors='replace')
+
+            print("\n" + SEP80)
             print("Analyzing resume...")
-            print("-"*80)
-            
-            analysis = self.analyzer.analyze_resume(resume_text, self.job_requirements)
-            self.analyzed_resumes.append(analysis)
+            print(SEP80)
             
+            analysis = self._cached_analyze(resume_text, self.job_requirements)
+            self._record(analysis)
+
             print(analysis['report'])
             
             # Auto-save
             candidate_name = analysis['resume_data']['name'].replace(' ', '_')
             report_filename = f"report_{candidate_name}_{len(self.analyzed_resumes)}.txt"
-            
-            with open(report_filename, 'w', encoding='utf-8') as f:
-                f.write(analysis['report'])
-            
+
+            _write_report(report_filename, analysis['report'])
+
             print(f"\n✓ Report saved to: {report_filename}")
             
         except FileNotFoundError:
@@ -192,33 +442,32 @@ class ResumeAnalyzerCLI:
             input("\nPress Enter to continue...")
             return
         
-        # Sort by match score
-        sorted_resumes = sorted(
-            self.analyzed_resumes, 
-            key=lambda x: x['match_score'], 
-            reverse=True
-        )
-        
-        print(f"{'Rank':<6} {'Name':<25} {'Email':<30} {'Score':<8} {'Status':<20}")
-        print("-"*100)
-        
-        for i, analysis in enumerate(sorted_resumes, 1):
+        # Build the whole screen, then emit it with a single write
+        out = [
+            _ROW_FMT('Rank', 'Name', 'Email', 'Score', 'Status'),
+            SEP100
+        ]
+
+        # Already kept in score order by _record
+        for i, analysis in enumerate(self._ranked, 1):
             name = analysis['resume_data']['name'][:24]
             email = analysis['resume_data']['email'][:29]
             score = analysis['match_score']
             status = analysis['recommendation'].split('-')[0].strip()[:19]
-            
-            print(f"{i:<6} {name:<25} {email:<30} {score:<8} {status:<20}")
-        
-        print("\n" + "="*100)
-        print(f"Total Candidates Analyzed: {len(self.analyzed_resumes)}")
-        
-        # Statistics
-        avg_score = sum(r['match_score'] for r in self.analyzed_resumes) / len(self.analyzed_resumes)
-        recommended = sum(1 for r in self.analyzed_resumes if r['match_score'] >= 60)
-        
-        print(f"Average Match Score: {avg_score:.1f}")
-        print(f"Recommended Candidates: {recommended}")
+
+            out.append(_ROW_FMT(i, name, email, score, status))
+
+        out.append("\n" + BAR100)
+        out.append(f"Total Candidates Analyzed: {len(self.analyzed_resumes)}")
+
+        # Statistics (maintained incrementally by _record)
+        avg_score = self._score_sum / len(self.analyzed_resumes)
+
+        out.append(f"Average Match Score: {avg_score:.1f}")
+        out.append(f"Recommended Candidates: {self._recommended_count}")
+
+        sys.stdout.write('\n'.join(out) + '\n')
+        sys.stdout.flush()
         
         input("\nPress Enter to continue...")
     
@@ -243,6 +492,7 @@ class ResumeAnalyzerCLI:
         
         if self.analyzer.save_data(self.analyzed_resumes, filename):
             print(f"\n✓ Successfully saved {len(self.analyzed_resumes)} results to: {filename}")
+            self._save_cache(filename)
         else:
             print("\n⚠ Failed to save results.")
         
@@ -265,8 +515,11 @@ class ResumeAnalyzerCLI:
         loaded_data = self.analyzer.load_data(filename)
         
         if loaded_data:
-            self.analyzed_resumes.extend(loaded_data)
-            print(f"\n✓ Successfully loaded {len(loaded_data)} results from: {filename}")
+            added = sum(1 for analysis in loaded_data if self._record(analysis, dedupe=True))
+            self._load_cache(filename)
+            print(f"\n✓ Successfully loaded {added} results from: {filename}")
+            if added < len(loaded_data):
+                print(f"  ({len(loaded_data) - added} duplicates skipped)")
         else:
             print(f"\n⚠ No data found in: {filename}")
         
@@ -290,7 +543,8 @@ class ResumeAnalyzerCLI:
             "required_experience": 5,
             "required_education": "Bachelor"
         }
-        
+        self._job_req_block = None
+
         sample_resumes = [
             """
             John Doe
@@ -336,14 +590,17 @@ class ResumeAnalyzerCLI:
             """
         ]
         
-        print("\n" + "-"*80)
+        print("\n" + SEP80)
         print("Analyzing resumes...")
-        print("-"*80 + "\n")
+        print(SEP80 + "\n")
         
-        for i, resume_text in enumerate(sample_resumes, 1):
-            print(f"Analyzing Resume {i}/3...")
-            analysis = self.analyzer.analyze_resume(resume_text, self.job_requirements)
-            self.analyzed_resumes.append(analysis)
+        print(f"Analyzing {len(sample_resumes)} resumes...")
+        analyses = self.analyzer.analyze_batch(sample_resumes, self.job_requirements)
+        for resume_text, analysis in zip(sample_resumes, analyses):
+            key = self._cache_key(resume_text, self.job_requirements)
+            if key not in self._analysis_cache:
+                self._cache_store(key, analysis)
+            self._record(analysis)
         
         print(f"\n✓ Demo completed! {len(sample_resumes)} resumes analyzed.")
         print("\nUse 'View All Results' to see the summary.")
@@ -354,54 +611,33 @@ class ResumeAnalyzerCLI:
         """Main application loop"""
         while True:
             self.clear_screen()
-            
-            menu_options = {
-                "1": "Set Job Requirements",
-                "2": "Analyze Resume (Manual Entry)",
-                "3": "Load Resume from File",
-                "4": "View All Results",
-                "5": "Save All Results",
-                "6": "Load Previous Results",
-                "7": "Run Demo",
-                "8": "Exit"
-            }
-            
-            self.print_menu("INTELLIGENT RESUME ANALYZER - MAIN MENU", menu_options)
-            
+
+            self.print_menu("INTELLIGENT RESUME ANALYZER - MAIN MENU", self._MENU)
+
             # Show current job requirements
             if self.job_requirements:
                 print("Current Job Requirements:")
-                print("-"*80)
+                print(SEP80)
                 self.display_job_requirements()
-                print("-"*80 + "\n")
-            
-            choice = self.get_input("Enter your choice (1-8): ", str)
-            
-            if choice == "1":
-                self.setup_job_requirements()
-            elif choice == "2":
-                self.analyze_single_resume()
-            elif choice == "3":
-                self.load_resume_from_file()
-            elif choice == "4":
-                self.view_all_results()
-            elif choice == "5":
-                self.save_all_results()
-            elif choice == "6":
-                self.load_previous_results()
-            elif choice == "7":
-                self.run_demo()
-            elif choice == "8":
+                print(SEP80 + "\n")
+
+            choice = self.get_input(f"Enter your choice (1-{len(self._MENU)}): ", str)
+
+            if choice == self._MENU[-1][0]:  # Exit
                 self.clear_screen()
-                print("\n" + "="*80)
+                print("\n" + BAR80)
                 print("Thank you for using Intelligent Resume Analyzer!".center(80))
-                print("="*80 + "\n")
+                print(BAR80 + "\n")
                 break
+
+            handler = self._DISPATCH.get(choice)
+            if handler is not None:
+                getattr(self, handler)()
             else:
-                print("\n⚠ Invalid choice. Please select 1-8.")
+                print(f"\n⚠ Invalid choice. Please select 1-{len(self._MENU)}.")
                 input("\nPress Enter to continue...")
 
 
 if __name__ == "__main__":
-    cli = ResumeAnalyzerCLI()
+    cli = ResumeAnalyzerCLI(use_disk_cache="--no-cache" not in sys.argv)
     cli.run()
\ No newline at end of file
@@ -3,220 +3,716 @@ Intelligent Resume Analyzer
 A Python-based application for automated resume screening and candidate matching
 """
 
+import bisect
+import hashlib
 import json
 import re
 import os
+import copy
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from typing import Dict, List, Tuple, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+try:
+    from rapidfuzz import fuzz as _rapidfuzz
+except ImportError:
+    _rapidfuzz = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+# Common technical and professional skills recognized by _extract_skills
+_SKILL_KEYWORDS = (
+    'python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin',
+    'html', 'css', 'react', 'angular', 'vue', 'node.js', 'django', 'flask',
+    'sql', 'mongodb', 'postgresql', 'mysql', 'oracle', 'nosql',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git',
+    'machine learning', 'deep learning', 'ai', 'data science', 'nlp',
+    'agile', 'scrum', 'devops', 'ci/cd', 'rest api', 'graphql',
+    'leadership', 'communication', 'project management', 'problem solving',
+    'teamwork', 'analytical', 'critical thinking', 'time management',
+    'excel', 'powerpoint', 'word', 'tableau', 'power bi',
+    'text processing', 'data extraction', 'json', 'algorithms',
+    'web scraping', 'automation', 'testing', 'debugging'
+)
+
+# Skill extraction tokenizes the text once and intersects the tokens with
+# the single-token vocabulary; only the few multi-word skills still need a
+# substring check. This avoids invoking the regex engine per keyword.
+_TOKEN_RE = re.compile(r'[a-z0-9+#./]+')
+# Splits glued tokens like 'html/css' or 'vue.js' into their parts
+_TOKEN_SPLIT_RE = re.compile(r'[./]')
+_SINGLE_TOKEN_SKILLS = frozenset(
+    skill for skill in _SKILL_KEYWORDS if ' ' not in skill and '/' not in skill
+)
+_MULTI_WORD_SKILLS = tuple(
+    skill for skill in _SKILL_KEYWORDS if skill not in _SINGLE_TOKEN_SKILLS
+)
+
+
+def _build_skill_trie(skills) -> Dict:
+    """Build a character trie; terminal nodes store the skill under '$'"""
+    trie = {}
+    for skill in skills:
+        node = trie
+        for ch in skill:
+            node = node.setdefault(ch, {})
+        node['$'] = skill
+    return trie
+
+
+# Trie over the multi-word skills: one boundary-aware pass over the text
+# matches all of them, instead of one substring scan per skill
+_MULTI_WORD_TRIE = _build_skill_trie(_MULTI_WORD_SKILLS)
+
+
+def _scan_multi_word_skills(text_lower: str) -> set:
+    """Collect multi-word skill matches in a single pass over the text"""
+    found = set()
+    n = len(text_lower)
+    for i in range(n):
+        # Matches must start at a word boundary
+        if i and text_lower[i - 1].isalnum():
+            continue
+        node = _MULTI_WORD_TRIE
+        j = i
+        while j < n:
+            node = node.get(text_lower[j])
+            if node is None:
+                break
+            j += 1
+            skill = node.get('$')
+            # ...and end at one too
+            if skill is not None and (j >= n or not text_lower[j].isalnum()):
+                found.add(skill)
+    return found
+# Vocabulary pre-sorted once; walking it in order yields a deduplicated,
+# already-sorted result list without a per-call set build and sort
+_SORTED_SKILLS = tuple(sorted(_SKILL_KEYWORDS))
+
+
+@lru_cache(maxsize=1)
+def _skill_automaton():
+    """Aho-Corasick automaton over the full skill vocabulary, built once"""
+    automaton = ahocorasick.Automaton()
+    for skill in _SKILL_KEYWORDS:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+# Batches at least this large are worth the process-pool spawn cost
+_BATCH_PARALLEL_THRESHOLD = 8
+
+
+def _score_kernel(matched_count: int, required_count: int,
+                  candidate_years: int, required_years: int,
+                  edu_tier: int) -> Tuple[int, int, int, int]:
+    """
+    Pure integer scoring kernel: (skills, experience, education, total)
+
+    edu_tier encodes the education check: 2 = requirement met (or no
+    requirement), 1 = partial credit, 0 = no match.
+    """
+    if required_count > 0:
+        skills_score = int(matched_count / required_count * 50)
+    else:
+        skills_score = 0
+
+    if required_years > 0:
+        if candidate_years >= required_years:
+            experience_score = 30
+        else:
+            experience_score = int(candidate_years / required_years * 30)
+    else:
+        experience_score = 30
+
+    if edu_tier == 2:
+        education_score = 20
+    elif edu_tier == 1:
+        education_score = 10
+    else:
+        education_score = 0
+
+    total = skills_score + experience_score + education_score
+    return skills_score, experience_score, education_score, total
+
+
+try:
+    # JIT-compile the kernel when numba is available; warm it up once so
+    # the compile cost isn't paid on the first scored candidate
+    from numba import njit
+    _score_kernel = njit(cache=True)(_score_kernel)
+    _score_kernel(0, 0, 0, 0, 0)
+except ImportError:
+    pass
+
+def fuzzy_ratio(a: str, b: str) -> float:
+    """
+    Similarity ratio in [0, 1] between two strings
+
+    Backed by rapidfuzz's C++ scorer when installed; otherwise falls
+    back to difflib's SequenceMatcher, which has matching semantics but
+    runs in pure Python.
+    """
+    if _rapidfuzz is not None:
+        return _rapidfuzz.ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+# Minimum fuzzy_ratio for a spelling-variant skill match; high enough
+# that "postgres"/"postgresql" pass but "java"/"javascript" do not
+_FUZZY_RESCUE_THRESHOLD = 0.85
+
+# Model used for the optional semantic skill-matching path
+_EMBED_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+
+@lru_cache(maxsize=1)
+def _embedder():
+    """
+    Load the sentence-transformer model once per process
+
+    The model load dominates the cost of the semantic path, so it is
+    shared by every analyzer instance; skill vectors themselves are
+    cheap single GEMMs once the model is resident.
+    """
+    return SentenceTransformer(_EMBED_MODEL_NAME)
+
+
+# Recommendation tiers as a sorted-cut lookup: bisect_right against the
+# cuts indexes straight into the message tuple, replacing the if/elif
+# chain run once per scored candidate
+_RECOMMENDATION_CUTS = (40, 60, 80)
+_RECOMMENDATION_MSGS = (
+    "NOT RECOMMENDED - Significant gaps in requirements",
+    "MAYBE - Potential candidate with some skill gaps",
+    "RECOMMENDED - Good candidate, consider for interview",
+    "HIGHLY RECOMMENDED - Excellent match for the position"
+)
+
+# Report separators, built once
+_BAR80 = '=' * 80
+_DASH80 = '-' * 80
+
+# Heuristic word lists shared by the line-level extractors
+_COMPANY_INDICATORS = ('inc', 'corp', 'ltd', 'llc', 'technologies', 'solutions', 'systems')
+_NAME_SKIP_WORDS = ('resume', 'cv', 'curriculum', 'vitae', 'profile', 'objective')
+
+# All extraction patterns compiled once at import; the extractors reuse
+# the Pattern objects instead of passing raw strings through re's cache
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+_PHONE_RES = [
+    re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+    re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+    re.compile(r'\+?\d{10,}')
+]
+
+# bytes twins of the contact patterns: emails and phone numbers are pure
+# ASCII, and re's bytes engine skips the Unicode branching of the str
+# path. The str patterns above stay for callers holding text
+_EMAIL_RE_B = re.compile(_EMAIL_RE.pattern.encode('ascii'))
+_PHONE_RES_B = [re.compile(p.pattern.encode('ascii')) for p in _PHONE_RES]
+
+# Contact patterns re-expressed for hyperscan's linear-time DFA; id 0 is
+# the email pattern, ids 1-3 mirror _PHONE_RES in priority order
+_HS_CONTACT_PATS = (
+    rb'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}',
+    rb'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+    rb'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+    rb'\+?\d{10,}',
+)
+
+
+@lru_cache(maxsize=1)
+def _hs_contact_db():
+    """Hyperscan database over the contact patterns, compiled once"""
+    db = hyperscan.Database()
+    db.compile(
+        expressions=list(_HS_CONTACT_PATS),
+        ids=list(range(len(_HS_CONTACT_PATS))),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_HS_CONTACT_PATS)
+    )
+    return db
+
+
+def _hs_contact_matches(text: str):
+    """
+    Scan text for contact patterns via hyperscan
+
+    Returns {pattern_id: matched_text} keeping the leftmost-longest hit
+    per pattern, or None when hyperscan is unavailable or the scan
+    fails (in which case it is disabled for the rest of the process and
+    the re-based extractors take over).
+    """
+    global hyperscan
+    if hyperscan is None:
+        return None
+    try:
+        data = text.encode('utf-8', errors='replace')
+        best = {}
+
+        def on_match(pat_id, start, end, _flags, _ctx):
+            current = best.get(pat_id)
+            if current is None or (start, -end) < (current[0], -current[1]):
+                best[pat_id] = (start, end)
+
+        _hs_contact_db().scan(data, match_event_handler=on_match)
+        return {pat_id: data[start:end].decode('utf-8', errors='replace')
+                for pat_id, (start, end) in best.items()}
+    except Exception:
+        # Permanent fallback: a broken native library shouldn't cost an
+        # exception per extraction
+        hyperscan = None
+        return None
+
+
+_YEAR_RES = [
+    re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience'),
+    re.compile(r'experience\s*:?\s*(\d+)\+?\s*years?'),
+    re.compile(r'(\d+)\+?\s*yrs?\s+(?:of\s+)?experience')
+]
+
+# All degree levels in one alternation so education extraction walks the
+# text once instead of once per pattern. No trailing tail: findall only
+# returns the group anyway, and consuming the rest of the line would
+# swallow any further degrees on it ("B.S. and M.S.")
+_EDU_RE = re.compile(
+    r'\b(B\.?S\.?|Bachelor|B\.?A\.?|B\.?Tech\.?|B\.?E\.?'
+    r'|M\.?S\.?|Master|M\.?A\.?|M\.?Tech\.?|M\.?B\.?A\.?'
+    r'|Ph\.?D\.?|Doctorate|Doctoral)\b',
+    re.IGNORECASE
+)
+
+
+def _head_lines(text: str, limit: int):
+    """
+    Yield up to ``limit`` lines from the top of the text
+
+    Leading blank lines are skipped; after the first yielded line, blanks
+    count toward the limit. Newline offsets are walked manually so a long
+    resume is never split into a full line list just to read its header.
+    """
+    pos = 0
+    yielded = 0
+    while yielded < limit:
+        idx = text.find('\n', pos)
+        line = text[pos:] if idx < 0 else text[pos:idx]
+        if yielded or line.strip():
+            yield line
+            yielded += 1
+        if idx < 0:
+            break
+        pos = idx + 1
+
+
+@dataclass(frozen=True, slots=True)
+class JobSpec:
+    """
+    Immutable, pre-normalized view of a job-requirements dict
+
+    Lowercasing the skill list and education string happens once at
+    construction, so scoring many candidates against the same spec pays
+    the normalization cost a single time.
+    """
+    position: str
+    required_skills_lower: frozenset
+    required_experience: int
+    required_education_lower: str
+
+    @classmethod
+    def from_dict(cls, job_requirements: Dict) -> "JobSpec":
+        """Build a spec from the plain-dict requirements format"""
+        return cls(
+            position=job_requirements.get('position', ''),
+            required_skills_lower=frozenset(
+                s.lower() for s in job_requirements.get('required_skills', [])
+            ),
+            required_experience=job_requirements.get('required_experience', 0),
+            required_education_lower=job_requirements.get('required_education', '').lower()
+        )
+
 
 class ResumeAnalyzer:
     """Main class for resume analysis and candidate matching"""
-    
+
     def __init__(self):
         self.resumes_data = []
         self.job_requirements = {}
         self.data_file = "resume_data.json"
+        self._job_spec = None
+
+    def configure(self, job_requirements: Dict) -> None:
+        """
+        Precompute matching structures for a set of job requirements
+
+        Callers that score many resumes against the same requirements
+        should configure once; calculate_match_score then reuses the
+        normalized JobSpec instead of re-lowercasing per call.
+
+        Args:
+            job_requirements: Job requirements dictionary
+        """
+        self.job_requirements = job_requirements
+        self._job_spec = JobSpec.from_dict(job_requirements)
         
-    def parse_resume(self, resume_text: str) -> Dict:
+    def parse_resume(self, resume_text: str, keep_raw: bool = False) -> Dict:
         """
         Parse resume text and extract key information
-        
+
         Args:
             resume_text: Raw text content of the resume
-            
+            keep_raw: Also retain the full resume text under "raw_text";
+                off by default since it dominates memory and JSON size
+
         Returns:
             Dictionary containing extracted information
         """
+        # Deep-copied so callers can mutate results without poisoning
+        # the shared cache entry
+        return copy.deepcopy(_parse_cached(resume_text, keep_raw))
+
+    def _parse_all(self, text: str, keep_raw: bool = False) -> Dict:
+        """
+        Single-pass parse computing all extracted fields
+
+        The lowercased text and line list are built once and shared by
+        every extractor, instead of each one re-deriving them from the
+        raw text.
+        """
+        text_lower = text.lower()
+        lines = text.split('\n')
+        # Encoded once; shared by the contact extractors and the hash
+        text_bytes = text.encode('utf-8', errors='replace')
+
+        hs_matches = _hs_contact_matches(text)
+        if hs_matches is not None:
+            email = hs_matches.get(0, "Email Not Found")
+            phone = next((hs_matches[i] for i in (1, 2, 3) if i in hs_matches),
+                         "Phone Not Found")
+        else:
+            email = self._email_from_bytes(text_bytes)
+            phone = self._phone_from_bytes(text_bytes)
+
         resume_data = {
-            "name": self._extract_name(resume_text),
-            "email": self._extract_email(resume_text),
-            "phone": self._extract_phone(resume_text),
-            "skills": self._extract_skills(resume_text),
-            "experience": self._extract_experience(resume_text),
-            "education": self._extract_education(resume_text),
-            "raw_text": resume_text
+            "name": self._name_from_lines(lines),
+            "email": email,
+            "phone": phone,
+            "skills": self._skills_from_lower(text_lower),
+            "experience": {
+                "total_years": self._years_from_lower(text_lower),
+                "companies": self._companies_from_lines(lines)
+            },
+            "education": self._extract_education(text),
+            # Short content fingerprint for traceability/deduplication
+            "resume_hash": hashlib.blake2b(text_bytes, digest_size=8).hexdigest()
         }
-        
+        if keep_raw:
+            resume_data["raw_text"] = text
+
+        # Normalized views computed once at parse time; re-scoring the
+        # same resume against many jobs then skips the join/lower rework
+        resume_data["_education_lower"] = ' '.join(resume_data["education"]).lower()
+        resume_data["_skills_lower"] = frozenset(s.lower() for s in resume_data["skills"])
+
         return resume_data
-    
-    def _extract_name(self, text: str) -> str:
-        """Extract candidate name from resume text"""
-        # Look for name in first few lines
-        lines = text.strip().split('\n')
-        for line in lines[:5]:
+
+    def _name_from_lines(self, lines: List[str]) -> str:
+        """Find the candidate name in the first few non-blank lines"""
+        start = 0
+        while start < len(lines) and not lines[start].strip():
+            start += 1
+        for line in lines[start:start + 5]:
             line = line.strip()
             # Name is typically 2-4 words, capitalized, at the beginning
             if line and len(line.split()) <= 4 and line[0].isupper():
                 # Skip common headers
-                skip_words = ['resume', 'cv', 'curriculum', 'vitae', 'profile', 'objective']
-                if not any(word in line.lower() for word in skip_words):
+                if not any(word in line.lower() for word in _NAME_SKIP_WORDS):
                     return line
         return "Name Not Found"
+
+    def _extract_name(self, text: str) -> str:
+        """Extract candidate name from resume text"""
+        return self._name_from_lines(list(_head_lines(text, 5)))
     
     def _extract_email(self, text: str) -> str:
         """Extract email address from resume text"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
-        return emails[0] if emails else "Email Not Found"
-    
+        hs_matches = _hs_contact_matches(text)
+        if hs_matches is not None:
+            return hs_matches.get(0, "Email Not Found")
+        return self._email_from_bytes(text.encode('utf-8', errors='replace'))
+
+    def _email_from_bytes(self, data: bytes) -> str:
+        """Extract email from UTF-8 encoded text (ASCII bytes fast path)"""
+        match = _EMAIL_RE_B.search(data)
+        return match.group().decode('ascii') if match else "Email Not Found"
+
     def _extract_phone(self, text: str) -> str:
         """Extract phone number from resume text"""
+        hs_matches = _hs_contact_matches(text)
+        if hs_matches is not None:
+            # Same priority order as _PHONE_RES
+            for pat_id in (1, 2, 3):
+                if pat_id in hs_matches:
+                    return hs_matches[pat_id]
+            return "Phone Not Found"
+        return self._phone_from_bytes(text.encode('utf-8', errors='replace'))
+
+    def _phone_from_bytes(self, data: bytes) -> str:
+        """Extract phone number from UTF-8 encoded text"""
         # Match various phone number formats
-        phone_patterns = [
-            r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            r'\+?\d{10,}'
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            if phones:
-                return phones[0]
+        for pattern in _PHONE_RES_B:
+            match = pattern.search(data)
+            if match:
+                return match.group().decode('ascii')
         return "Phone Not Found"
     
     def _extract_skills(self, text: str) -> List[str]:
         """Extract skills from resume text"""
-        # Common technical and professional skills
-        skill_keywords = [
-            'python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin',
-            'html', 'css', 'react', 'angular', 'vue', 'node.js', 'django', 'flask',
-            'sql', 'mongodb', 'postgresql', 'mysql', 'oracle', 'nosql',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git',
-            'machine learning', 'deep learning', 'ai', 'data science', 'nlp',
-            'agile', 'scrum', 'devops', 'ci/cd', 'rest api', 'graphql',
-            'leadership', 'communication', 'project management', 'problem solving',
-            'teamwork', 'analytical', 'critical thinking', 'time management',
-            'excel', 'powerpoint', 'word', 'tableau', 'power bi',
-            'text processing', 'data extraction', 'json', 'algorithms',
-            'web scraping', 'automation', 'testing', 'debugging'
-        ]
-        
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in skill_keywords:
-            # Use word boundary to avoid partial matches
-            if re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
-                found_skills.append(skill.title())
-        
-        # Remove duplicates and sort
-        found_skills = sorted(list(set(found_skills)))
-        
+        return self._skills_from_lower(text.lower())
+
+    def _skills_from_lower(self, text_lower: str) -> List[str]:
+        """Extract skills from already-lowercased resume text"""
+        if ahocorasick is not None:
+            # One C-level automaton pass matches the whole vocabulary;
+            # boundary checks keep 'ai' from matching inside 'maintain'
+            found = set()
+            n = len(text_lower)
+            for end, skill in _skill_automaton().iter(text_lower):
+                start = end - len(skill) + 1
+                if ((start == 0 or not text_lower[start - 1].isalnum())
+                        and (end + 1 >= n or not text_lower[end + 1].isalnum())):
+                    found.add(skill)
+        else:
+            # One tokenization pass, then O(1) membership per skill
+            tokens = set(_TOKEN_RE.findall(text_lower))
+            for token in list(tokens):
+                # 'docker.' at a sentence end should still count as 'docker'
+                stripped = token.strip('./')
+                if stripped != token:
+                    tokens.add(stripped)
+                # 'html/css' and 'vue.js' glue separate skills into one
+                # token; add the parts while keeping the whole token so
+                # 'node.js' still matches ('ci/cd' comes via the trie)
+                if '/' in token or '.' in token:
+                    tokens.update(
+                        part for part in _TOKEN_SPLIT_RE.split(token) if part
+                    )
+
+            found = set(_SINGLE_TOKEN_SKILLS & tokens)
+            found |= _scan_multi_word_skills(text_lower)
+
+        # Walk the pre-sorted vocabulary: output is unique and ordered
+        found_skills = [skill.title() for skill in _SORTED_SKILLS if skill in found]
+
         return found_skills if found_skills else ["No skills detected"]
     
     def _extract_experience(self, text: str) -> Dict:
         """Extract years of experience from resume text"""
-        experience = {
-            "total_years": 0,
-            "companies": []
+        return {
+            "total_years": self._years_from_lower(text.lower()),
+            "companies": self._companies_from_lines(text.split('\n'))
         }
-        
-        # Look for years of experience patterns
-        year_patterns = [
-            r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-            r'experience\s*:?\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*yrs?\s+(?:of\s+)?experience'
-        ]
-        
-        for pattern in year_patterns:
-            matches = re.findall(pattern, text.lower())
+
+    def _years_from_lower(self, text_lower: str) -> int:
+        """Find the stated years of experience in lowercased text"""
+        for pattern in _YEAR_RES:
+            matches = pattern.findall(text_lower)
             if matches:
-                experience['total_years'] = int(matches[0])
-                break
-        
-        # Extract company names (basic heuristic)
-        company_indicators = ['inc', 'corp', 'ltd', 'llc', 'technologies', 'solutions', 'systems']
-        lines = text.split('\n')
+                return int(matches[0])
+        return 0
+
+    def _companies_from_lines(self, lines: List[str]) -> List[str]:
+        """Collect likely company names (basic heuristic)"""
+        companies = []
         for line in lines:
             line_lower = line.lower()
-            if any(indicator in line_lower for indicator in company_indicators):
+            if any(indicator in line_lower for indicator in _COMPANY_INDICATORS):
                 company = line.strip()
                 if len(company.split()) <= 6:  # Reasonable company name length
-                    experience['companies'].append(company)
-        
-        return experience
+                    companies.append(company)
+        return companies
     
     def _extract_education(self, text: str) -> List[str]:
         """Extract education details from resume text"""
-        education = []
-        
-        # Common degree patterns
-        degree_patterns = [
-            r'\b(B\.?S\.?|Bachelor|B\.?A\.?|B\.?Tech\.?|B\.?E\.?)\b.*',
-            r'\b(M\.?S\.?|Master|M\.?A\.?|M\.?Tech\.?|MBA|M\.?B\.?A\.?)\b.*',
-            r'\b(Ph\.?D\.?|Doctorate|Doctoral)\b.*'
-        ]
-        
-        for pattern in degree_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            education.extend(matches)
-        
+        education = _EDU_RE.findall(text)
         return education if education else ["Education information not found"]
     
     def calculate_match_score(self, resume_data: Dict, job_requirements: Dict) -> Tuple[int, Dict]:
         """
         Calculate match score between resume and job requirements
-        
+
         Args:
             resume_data: Parsed resume data
-            job_requirements: Job requirements dictionary
-            
+            job_requirements: Job requirements dictionary, or an
+                already-normalized JobSpec
+
         Returns:
             Tuple of (match_score, detailed_breakdown)
         """
+        # Normalize once into a JobSpec; configured callers reuse the
+        # spec built in configure()
+        if isinstance(job_requirements, JobSpec):
+            spec = job_requirements
+        elif job_requirements is self.job_requirements and self._job_spec is not None:
+            spec = self._job_spec
+        else:
+            spec = JobSpec.from_dict(job_requirements)
+
         score_breakdown = {
             "skills_score": 0,
             "experience_score": 0,
             "education_score": 0,
             "total_score": 0
         }
-        
+
         # Skills matching (50% weight)
-        required_skills = [s.lower() for s in job_requirements.get('required_skills', [])]
-        candidate_skills = [s.lower() for s in resume_data.get('skills', [])]
-        
+        required_skills = spec.required_skills_lower
+        # Prefer the normalized view cached at parse time; fall back for
+        # hand-built dicts and data round-tripped through JSON
+        candidate_skills = resume_data.get('_skills_lower')
+        if not isinstance(candidate_skills, frozenset):
+            candidate_skills = frozenset(s.lower() for s in resume_data.get('skills', []))
+
+        matched_count = 0
         if required_skills:
-            matched_skills = [s for s in required_skills if s in candidate_skills]
-            skills_match_rate = len(matched_skills) / len(required_skills)
-            score_breakdown['skills_score'] = int(skills_match_rate * 50)
-            score_breakdown['matched_skills'] = matched_skills
-            score_breakdown['missing_skills'] = [s for s in required_skills if s not in candidate_skills]
-        
+            matched_skills = required_skills & candidate_skills
+            matched_count = len(matched_skills)
+            score_breakdown['matched_skills'] = sorted(matched_skills)
+            score_breakdown['missing_skills'] = sorted(required_skills - candidate_skills)
+
         # Experience matching (30% weight)
-        required_years = job_requirements.get('required_experience', 0)
+        required_years = spec.required_experience
         candidate_years = resume_data.get('experience', {}).get('total_years', 0)
-        
-        if required_years > 0:
-            if candidate_years >= required_years:
-                score_breakdown['experience_score'] = 30
-            else:
-                # Partial score based on percentage
-                score_breakdown['experience_score'] = int((candidate_years / required_years) * 30)
-        else:
-            score_breakdown['experience_score'] = 30  # No requirement
-        
-        # Education matching (20% weight)
-        required_education = job_requirements.get('required_education', '').lower()
-        candidate_education = ' '.join(resume_data.get('education', [])).lower()
-        
-        if required_education:
-            if required_education in candidate_education:
-                score_breakdown['education_score'] = 20
-            elif any(edu in candidate_education for edu in ['bachelor', 'master', 'phd']):
-                score_breakdown['education_score'] = 10  # Partial credit
+
+        # Education matching (20% weight), encoded as a tier for the kernel
+        required_education = spec.required_education_lower
+        candidate_education = resume_data.get('_education_lower')
+        if candidate_education is None:
+            candidate_education = ' '.join(resume_data.get('education', [])).lower()
+
+        if not required_education or required_education in candidate_education:
+            edu_tier = 2
+        elif any(edu in candidate_education for edu in ('bachelor', 'master', 'phd')):
+            edu_tier = 1  # Partial credit
         else:
-            score_breakdown['education_score'] = 20  # No requirement
-        
-        # Calculate total score
-        score_breakdown['total_score'] = (
-            score_breakdown['skills_score'] + 
-            score_breakdown['experience_score'] + 
-            score_breakdown['education_score']
+            edu_tier = 0
+
+        # All numeric work happens in the (optionally JIT-compiled) kernel
+        (score_breakdown['skills_score'],
+         score_breakdown['experience_score'],
+         score_breakdown['education_score'],
+         score_breakdown['total_score']) = _score_kernel(
+            matched_count, len(required_skills),
+            candidate_years, required_years, edu_tier
         )
-        
+
         return score_breakdown['total_score'], score_breakdown
-    
+
+    def calculate_match_scores_batch(self, resume_datas: List[Dict],
+                                     job_requirements: Dict) -> List[Tuple[int, Dict]]:
+        """
+        Score many parsed resumes against one set of job requirements
+
+        The requirements are normalized once into a JobSpec, so N
+        candidates cost N set intersections instead of N full
+        re-normalizations of the required skill list.
+
+        Args:
+            resume_datas: List of parsed resume data dictionaries
+            job_requirements: Job requirements dictionary
+
+        Returns:
+            List of (match_score, detailed_breakdown) tuples, in input order
+        """
+        spec = JobSpec.from_dict(job_requirements)
+        return [
+            self.calculate_match_score(resume_data, spec)
+            for resume_data in resume_datas
+        ]
+
+    def calculate_match_score_semantic(self, resume_data: Dict, job_requirements: Dict,
+                                       similarity_threshold: float = 0.6) -> Tuple[int, Dict]:
+        """
+        Match score with embedding-based skill matching on top of the exact match
+
+        Required skills missed by the keyword matcher get a second chance
+        via sentence-transformer embeddings: every candidate/required
+        skill pair is scored in one cosine-similarity matmul, and pairs
+        above the threshold count as matches ("js" vs "javascript").
+        Without sentence-transformers it degrades to a fuzzy_ratio check
+        that still catches spelling variants ("postgres"/"postgresql").
+
+        Args:
+            resume_data: Parsed resume data
+            job_requirements: Job requirements dictionary
+            similarity_threshold: Minimum cosine similarity for a
+                semantic skill match
+
+        Returns:
+            Tuple of (match_score, detailed_breakdown)
+        """
+        match_score, score_breakdown = self.calculate_match_score(resume_data, job_requirements)
+
+        missing = score_breakdown.get('missing_skills')
+        candidate_skills = [s.lower() for s in resume_data.get('skills', [])]
+        if not missing or not candidate_skills:
+            return match_score, score_breakdown
+
+        if SentenceTransformer is not None:
+            model = _embedder()
+            cand_vecs = model.encode(candidate_skills, normalize_embeddings=True)
+            miss_vecs = model.encode(missing, normalize_embeddings=True)
+            # One GEMM scores every candidate/missing pair at once
+            sim = cand_vecs @ miss_vecs.T
+
+            rescued = {
+                skill for j, skill in enumerate(missing)
+                if float(sim[:, j].max()) >= similarity_threshold
+            }
+        else:
+            # Degraded tier without the embedding model: catch spelling
+            # variants with a plain string-similarity ratio
+            rescued = {
+                skill for skill in missing
+                if any(fuzzy_ratio(cand, skill) >= _FUZZY_RESCUE_THRESHOLD
+                       for cand in candidate_skills)
+            }
+        if not rescued:
+            return match_score, score_breakdown
+
+        matched = set(score_breakdown.get('matched_skills', [])) | rescued
+        required_count = len(matched) + len(set(missing) - rescued)
+        score_breakdown['matched_skills'] = sorted(matched)
+        score_breakdown['missing_skills'] = sorted(set(missing) - rescued)
+
+        skills_score = int(len(matched) / required_count * 50)
+        score_breakdown['total_score'] += skills_score - score_breakdown['skills_score']
+        score_breakdown['skills_score'] = skills_score
+
+        return score_breakdown['total_score'], score_breakdown
+
     def generate_recommendation(self, match_score: int, score_breakdown: Dict) -> str:
         """
         Generate hiring recommendation based on match score
@@ -228,39 +724,43 @@ class ResumeAnalyzer:
         Returns:
             Recommendation string
         """
-        if match_score >= 80:
-            return "HIGHLY RECOMMENDED - Excellent match for the position"
-        elif match_score >= 60:
-            return "RECOMMENDED - Good candidate, consider for interview"
-        elif match_score >= 40:
-            return "MAYBE - Potential candidate with some skill gaps"
-        else:
-            return "NOT RECOMMENDED - Significant gaps in requirements"
+        return _RECOMMENDATION_MSGS[bisect.bisect_right(_RECOMMENDATION_CUTS, match_score)]
     
-    def generate_report(self, resume_data: Dict, job_requirements: Dict, 
-                       match_score: int, score_breakdown: Dict) -> str:
+    def generate_report(self, resume_data: Dict, job_requirements: Dict,
+                       match_score: int, score_breakdown: Dict,
+                       timestamp: Optional[str] = None,
+                       recommendation: Optional[str] = None) -> str:
         """
         Generate detailed analysis report
-        
+
         Args:
             resume_data: Parsed resume data
             job_requirements: Job requirements
             match_score: Overall match score
             score_breakdown: Detailed score breakdown
-            
+            timestamp: Optional pre-formatted generation time, so callers
+                that already took a datetime.now() can reuse it
+            recommendation: Optional precomputed recommendation string,
+                for callers that already generated one
+
         Returns:
             Formatted report string
         """
-        recommendation = self.generate_recommendation(match_score, score_breakdown)
-        
-        report = f"""
-{'='*80}
+        if timestamp is None:
+            timestamp = datetime.now().isoformat(sep=' ', timespec='seconds')
+        if recommendation is None:
+            recommendation = self.generate_recommendation(match_score, score_breakdown)
+
+        # Assemble into a list and join once; repeated str += copies the
+        # whole buffer each time
+        parts = [f"""
+{_BAR80}
 CANDIDATE ANALYSIS REPORT
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-{'='*80}
+Generated: {timestamp}
+{_BAR80}
 
 CANDIDATE INFORMATION
-{'-'*80}
+{_DASH80}
 Name:           {resume_data.get('name', 'N/A')}
 Email:          {resume_data.get('email', 'N/A')}
 Phone:          {resume_data.get('phone', 'N/A')}
@@ -269,53 +769,81 @@ MATCH SCORE: {match_score}/100
 RECOMMENDATION: {recommendation}
 
 DETAILED BREAKDOWN
-{'-'*80}
+{_DASH80}
 Skills Match:       {score_breakdown['skills_score']}/50 points
 Experience Match:   {score_breakdown['experience_score']}/30 points
 Education Match:    {score_breakdown['education_score']}/20 points
 
 SKILLS ANALYSIS
-{'-'*80}
+{_DASH80}
 Candidate Skills: {', '.join(resume_data.get('skills', ['None']))}
 
-"""
-        
+"""]
+        append = parts.append
+
         if 'matched_skills' in score_breakdown:
-            report += f"Matched Skills:   {', '.join(score_breakdown['matched_skills']) if score_breakdown['matched_skills'] else 'None'}\n"
-            report += f"Missing Skills:   {', '.join(score_breakdown['missing_skills']) if score_breakdown['missing_skills'] else 'None'}\n"
-        
-        report += f"""
+            append(f"Matched Skills:   {', '.join(score_breakdown['matched_skills']) if score_breakdown['matched_skills'] else 'None'}\n")
+            append(f"Missing Skills:   {', '.join(score_breakdown['missing_skills']) if score_breakdown['missing_skills'] else 'None'}\n")
+
+        append(f"""
 EXPERIENCE
-{'-'*80}
+{_DASH80}
 Total Years: {resume_data.get('experience', {}).get('total_years', 0)} years
 Required:    {job_requirements.get('required_experience', 0)} years
 
 EDUCATION
-{'-'*80}
+{_DASH80}
 {', '.join(resume_data.get('education', ['Not specified']))}
 
-{'='*80}
+{_BAR80}
 END OF REPORT
-{'='*80}
-"""
-        
-        return report
-    
-    def save_data(self, data: List[Dict], filename: Optional[str] = None) -> bool:
+{_BAR80}
+""")
+
+        return ''.join(parts)
+
+    def generate_report_bytes(self, *args, **kwargs) -> bytes:
+        """
+        UTF-8 encoded variant of generate_report
+
+        Encodes the assembled report once, so callers that work at the
+        byte level (file writers, byte-string scans) skip a second pass
+        over the text. Accepts the same arguments as generate_report.
+        """
+        return self.generate_report(*args, **kwargs).encode('utf-8')
+
+    def save_data(self, data: List[Dict], filename: Optional[str] = None,
+                  pretty: bool = False) -> bool:
         """
         Save resume data to JSON file
-        
+
         Args:
             data: List of resume data dictionaries
             filename: Optional filename (defaults to self.data_file)
-            
+            pretty: Indent the output for human readers (bigger, slower)
+
         Returns:
             True if successful, False otherwise
         """
         try:
             filename = filename or self.data_file
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # default=list flattens the frozenset views parse_resume
+            # caches on resume_data (e.g. _skills_lower)
+            if orjson is not None:
+                # C serializer; writes the encoded bytes in one call.
+                # OPT_NON_STR_KEYS matches stdlib json, which coerces
+                # non-string dict keys instead of raising
+                option = orjson.OPT_NON_STR_KEYS
+                if pretty:
+                    option |= orjson.OPT_INDENT_2
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data, option=option, default=list))
+            elif pretty:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False, default=list)
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, separators=(',', ':'), ensure_ascii=False, default=list)
             return True
         except Exception as e:
             print(f"Error saving data: {str(e)}")
@@ -333,9 +861,13 @@ END OF REPORT
         """
         try:
             filename = filename or self.data_file
-            if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    return orjson.loads(f.read())
+            with open(filename, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            # Normal first-run case: no saved data yet
             return []
         except Exception as e:
             print(f"Error loading data: {str(e)}")
@@ -354,25 +886,91 @@ END OF REPORT
         """
         # Parse resume
         resume_data = self.parse_resume(resume_text)
-        
+
         # Calculate match score
         match_score, score_breakdown = self.calculate_match_score(resume_data, job_requirements)
-        
+
+        # One clock read per analysis, reused for the report and metadata
+        now = datetime.now()
+
+        # One recommendation too, shared by the report and the results
+        recommendation = self.generate_recommendation(match_score, score_breakdown)
+
         # Generate report
-        report = self.generate_report(resume_data, job_requirements, match_score, score_breakdown)
-        
+        report = self.generate_report(
+            resume_data, job_requirements, match_score, score_breakdown,
+            timestamp=now.isoformat(sep=' ', timespec='seconds'),
+            recommendation=recommendation
+        )
+
         # Compile results
         results = {
             "resume_data": resume_data,
             "match_score": match_score,
             "score_breakdown": score_breakdown,
-            "recommendation": self.generate_recommendation(match_score, score_breakdown),
+            "recommendation": recommendation,
             "report": report,
-            "analyzed_at": datetime.now().isoformat()
+            "analyzed_at": now.isoformat()
         }
-        
+
         return results
 
+    def analyze_batch(self, resume_texts: List[str], job_requirements: Dict) -> List[Dict]:
+        """
+        Analyze multiple resumes against the same job requirements
+
+        Shared setup (compiled patterns, keyword tables) is paid once per
+        batch instead of once per call, so bulk paths should prefer this
+        over looping analyze_resume.
+
+        Large batches are spread over a process pool, since analysis is
+        CPU-bound Python work that scales with cores; small batches stay
+        serial to avoid the pool spawn cost.
+
+        Args:
+            resume_texts: List of raw resume texts
+            job_requirements: Job requirements dictionary
+
+        Returns:
+            List of complete analysis results, one per resume
+        """
+        if len(resume_texts) >= _BATCH_PARALLEL_THRESHOLD and (os.cpu_count() or 1) > 1:
+            with ProcessPoolExecutor() as pool:
+                return list(pool.map(
+                    partial(_analyze_one, job_requirements=job_requirements),
+                    resume_texts,
+                    chunksize=16
+                ))
+        return [self.analyze_resume(text, job_requirements) for text in resume_texts]
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(text: str, keep_raw: bool) -> Dict:
+    """
+    Memoized parse shared by all analyzer instances
+
+    Recruiting pipelines see the same resume repeatedly (multiple
+    requisitions, re-runs); identical text parses once and later calls
+    are O(1) lookups. Parsing is stateless, so a throwaway instance does
+    the actual work.
+    """
+    return ResumeAnalyzer()._parse_all(text, keep_raw=keep_raw)
+
+
+def _analyze_one(resume_text: str, job_requirements: Dict) -> Dict:
+    """Analyze a single resume in a worker process (module-level so it pickles)"""
+    return ResumeAnalyzer().analyze_resume(resume_text, job_requirements)
+
+
+def _write_report(path: str, text: str) -> None:
+    """Write a report file with a single pre-encoded OS write"""
+    data = text.encode('utf-8')
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
 
 def main():
     """Main function demonstrating the resume analyzer"""
@@ -469,29 +1067,34 @@ def main():
         """
     ]
     
-    # Analyze all resumes
-    results = []
-    for i, resume_text in enumerate(sample_resumes, 1):
+    # Analyze all resumes in one batch call; report writes overlap with
+    # the remaining analysis/printing work via a small I/O pool
+    io_pool = ThreadPoolExecutor(max_workers=4)
+    report_writes = []
+    results = analyzer.analyze_batch(sample_resumes, job_requirements)
+    for i, analysis in enumerate(results, 1):
         print(f"\n{'='*80}")
-        print(f"ANALYZING RESUME {i}/3")
+        print(f"ANALYZING RESUME {i}/{len(results)}")
         print('='*80)
-        
-        analysis = analyzer.analyze_resume(resume_text, job_requirements)
-        results.append(analysis)
-        
+
         print(analysis['report'])
         
-        # Save individual report
+        # Save individual report in the background
         report_filename = f"candidate_{i}_report.txt"
-        with open(report_filename, 'w', encoding='utf-8') as f:
-            f.write(analysis['report'])
+        report_writes.append(io_pool.submit(_write_report, report_filename, analysis['report']))
         print(f"\nReport saved to: {report_filename}")
-    
+
+    # Make sure all report writes have landed before the final save;
+    # result() re-raises if any write failed instead of swallowing it
+    for future in report_writes:
+        future.result()
+    io_pool.shutdown(wait=True)
+
     # Save all results to JSON
     print(f"\n{'='*80}")
     print("SAVING RESULTS")
     print('='*80)
-    
+
     if analyzer.save_data(results, "all_candidates_analysis.json"):
         print("✓ All results saved to: all_candidates_analysis.json")
     